@@ -7,4 +7,5 @@ enum AppConfig {
     static let author = "Russ McKendrick"
     static let description = "A simple Last.fm scrobbler for vinyl records."
     static let githubURL = "https://www.vinyl-scrobbler.app/"
+    static let userAgent = "VinylScrobbler/1.0 +https://www.vinyl-scrobbler.app/"
 }
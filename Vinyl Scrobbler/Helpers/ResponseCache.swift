@@ -0,0 +1,98 @@
+import Foundation
+
+/// Helper struct providing a simple on-disk cache for raw API responses
+/// Entries are stored as files under the app's Caches directory and expire once they
+/// are older than `maxAge`, so repeat lookups can skip the network entirely
+struct ResponseCache {
+    /// Directory holding the cached responses
+    let directory: URL
+    /// Maximum age of a cached response before it is considered stale
+    let maxAge: TimeInterval
+
+    /// Creates a cache stored in its own subdirectory of the Caches directory
+    /// Entries that expired since the last launch are removed in the background
+    /// - Parameters:
+    ///   - name: Name of the subdirectory for this cache
+    ///   - maxAge: Maximum age of a cached response in seconds
+    init(name: String, maxAge: TimeInterval) {
+        let caches = FileManager.default.urls(for: .cachesDirectory, in: .userDomainMask)[0]
+        let bundleIdentifier = Bundle.main.bundleIdentifier ?? "com.vinyl.scrobbler"
+        directory = caches
+            .appendingPathComponent(bundleIdentifier, isDirectory: true)
+            .appendingPathComponent(name, isDirectory: true)
+        self.maxAge = maxAge
+
+        try? FileManager.default.createDirectory(at: directory, withIntermediateDirectories: true)
+
+        let cache = self
+        Task.detached(priority: .utility) {
+            await cache.removeExpiredEntries()
+        }
+    }
+
+    /// Returns the cached response for a key if it exists and has not expired
+    /// Expired entries are removed from disk. The file is read off the caller's actor
+    /// - Parameter key: The cache key (must be safe to use as a file name)
+    /// - Returns: The cached response data, or nil if missing or stale
+    func data(forKey key: String) async -> Data? {
+        await entry(forKey: key)?.data
+    }
+
+    /// Returns the cached response for a key together with the time it was stored,
+    /// so callers keeping their own copy can expire it at the same time
+    /// - Parameter key: The cache key (must be safe to use as a file name)
+    /// - Returns: The cached response data and its storage date, or nil if missing or stale
+    func entry(forKey key: String) async -> (data: Data, storedAt: Date)? {
+        let url = fileURL(forKey: key)
+
+        guard let attributes = try? FileManager.default.attributesOfItem(atPath: url.path),
+              let modified = attributes[.modificationDate] as? Date else {
+            return nil
+        }
+
+        guard Date().timeIntervalSince(modified) < maxAge else {
+            try? FileManager.default.removeItem(at: url)
+            return nil
+        }
+
+        guard let data = try? Data(contentsOf: url) else {
+            return nil
+        }
+        return (data: data, storedAt: modified)
+    }
+
+    /// Stores a response for a key, replacing any existing entry
+    /// The file is written off the caller's actor
+    /// - Parameters:
+    ///   - data: The raw response data
+    ///   - key: The cache key (must be safe to use as a file name)
+    func store(_ data: Data, forKey key: String) async {
+        try? data.write(to: fileURL(forKey: key), options: .atomic)
+    }
+
+    /// Deletes every entry older than `maxAge`, so responses that are never
+    /// looked up again don't accumulate on disk
+    func removeExpiredEntries() async {
+        guard let urls = try? FileManager.default.contentsOfDirectory(
+            at: directory,
+            includingPropertiesForKeys: [.contentModificationDateKey],
+            options: .skipsHiddenFiles
+        ) else {
+            return
+        }
+
+        let now = Date()
+        for url in urls {
+            guard let modified = try? url.resourceValues(forKeys: [.contentModificationDateKey]).contentModificationDate,
+                  now.timeIntervalSince(modified) >= maxAge else {
+                continue
+            }
+            try? FileManager.default.removeItem(at: url)
+        }
+    }
+
+    /// File location for a cache key
+    private func fileURL(forKey key: String) -> URL {
+        directory.appendingPathComponent(key).appendingPathExtension("json")
+    }
+}
@@ -2,6 +2,7 @@ import SwiftUI
 import Combine
 import ScrobbleKit
 import UserNotifications
+import OSLog
 
 /// Main state management class for the Vinyl Scrobbler application.
 /// Handles playback control, Last.fm integration, theme management, and UI state.
@@ -82,25 +83,35 @@ class AppState: ObservableObject {
     
     // MARK: - Private Properties
     
+    /// Logger for playback, scrobbling and release loading events
+    nonisolated private static let logger = Logger(subsystem: "com.vinyl.scrobbler", category: "AppState")
     /// Service for interacting with Last.fm API
     private let lastFMService: LastFMService
     /// Service for interacting with Discogs API
     private let discogsService: DiscogsService
     /// Timer for tracking playback progress
     private var playbackTimer: Timer?
+    /// Clock reading at which the current track would have been at position zero
+    /// The suspending clock stops while the Mac sleeps, so playback pauses with it
+    /// instead of jumping past the end of the track on wake
+    private var playbackStartInstant: SuspendingClock.Instant?
     /// Flag to determine if the current track should be scrobbled
     private var shouldScrobble = false
+    /// Monotonic counter used to build unique notification identifiers
+    private var notificationCounter = 0
+    /// Pending "Now Playing" update, replaced whenever the track changes
+    private var nowPlayingTask: Task<Void, Never>?
+    /// Delay before reporting a track change to Last.fm
+    private let nowPlayingDebounce: Duration = .milliseconds(300)
+    /// Last.fm artwork sizes to use, in order of preference
+    nonisolated private static let lastFMArtworkSizes = ["extralarge", "large"]
     
     // MARK: - Initialization
     
     /// Initializes the AppState with default values and required services
     init() {
-        // Load theme configuration
-        guard let url = Bundle.main.url(forResource: "ColorTheme", withExtension: "json"),
-              let data = try? Data(contentsOf: url),
-              let theme = try? JSONDecoder().decode(Theme.self, from: data) else {
-            fatalError("Failed to load theme configuration")
-        }
+        // Load theme configuration (decoded once and cached)
+        let theme = Theme.bundled
         self.theme = theme
         self.currentTheme = theme.themes.dark // Default to dark theme initially
         
@@ -181,18 +192,11 @@ class AppState: ObservableObject {
         }
         
         guard currentTrackIndex > 0 else { return }
-        // Sort tracks by position before finding the previous track
-        let sortedTracks = tracks.sorted { $0.position < $1.position }
-        let currentPosition = tracks[currentTrackIndex].position
-        if let newIndex = sortedTracks.firstIndex(where: { $0.position == currentPosition }) {
-            let previousIndex = newIndex - 1
-            if previousIndex >= 0 {
-                currentTrackIndex = tracks.firstIndex(where: { $0.position == sortedTracks[previousIndex].position }) ?? (currentTrackIndex - 1)
-                currentTrack = tracks[currentTrackIndex]
-                resetPlayback()
-                updateNowPlaying()
-            }
-        }
+        // Tracks are kept sorted by position, so the previous track is the previous index
+        currentTrackIndex -= 1
+        currentTrack = tracks[currentTrackIndex]
+        resetPlayback()
+        updateNowPlaying()
     }
     
     /// Moves to the next track in the playlist
@@ -203,35 +207,36 @@ class AppState: ObservableObject {
         }
         
         guard currentTrackIndex < tracks.count - 1 else { return }
-        // Sort tracks by position before finding the next track
-        let sortedTracks = tracks.sorted { $0.position < $1.position }
-        let currentPosition = tracks[currentTrackIndex].position
-        if let newIndex = sortedTracks.firstIndex(where: { $0.position == currentPosition }) {
-            let nextIndex = newIndex + 1
-            if nextIndex < sortedTracks.count {
-                currentTrackIndex = tracks.firstIndex(where: { $0.position == sortedTracks[nextIndex].position }) ?? (currentTrackIndex + 1)
-                currentTrack = tracks[currentTrackIndex]
-                resetPlayback()
-                updateNowPlaying()
-            }
-        }
+        // Tracks are kept sorted by position, so the next track is the next index
+        currentTrackIndex += 1
+        currentTrack = tracks[currentTrackIndex]
+        resetPlayback()
+        updateNowPlaying()
     }
     
     /// Starts the playback timer and enables scrobbling
     private func startPlayback() {
         playbackTimer?.invalidate()
         shouldScrobble = true
-        playbackTimer = Timer.scheduledTimer(withTimeInterval: 1.0, repeats: true) { [weak self] _ in
-            Task { @MainActor [weak self] in
+        // Anchor the track position to the clock so late or coalesced ticks don't drift
+        playbackStartInstant = SuspendingClock.now - .seconds(currentPlaybackSeconds)
+        // The timer is scheduled on the main run loop, so tick synchronously on the
+        // main actor instead of hopping through a new Task every second
+        let timer = Timer.scheduledTimer(withTimeInterval: 1.0, repeats: true) { [weak self] _ in
+            MainActor.assumeIsolated {
                 self?.updatePlayback()
             }
         }
+        // Allow the system to coalesce wake-ups with other timers
+        timer.tolerance = 0.1
+        playbackTimer = timer
     }
     
     /// Stops playback and resets playback state
     private func stopPlayback() {
         playbackTimer?.invalidate()
         playbackTimer = nil
+        playbackStartInstant = nil
         currentPlaybackSeconds = 0
         currentSeconds = 0
         shouldScrobble = false
@@ -242,7 +247,7 @@ class AppState: ObservableObject {
         currentPlaybackSeconds = 0
         currentSeconds = 0
         shouldScrobble = true
-        print("🔄 Reset playback - Scrobbling enabled")
+        Self.logger.debug("🔄 Reset playback - Scrobbling enabled")
         if isPlaying {
             stopPlayback()
             startPlayback()
@@ -251,18 +256,23 @@ class AppState: ObservableObject {
     
     /// Updates playback progress and handles scrobbling
     private func updatePlayback() {
-        currentPlaybackSeconds += 1
+        // Derive the position from the elapsed time rather than counting ticks
+        guard let start = playbackStartInstant else { return }
+        let elapsed = (SuspendingClock.now - start) / .seconds(1)
+        currentPlaybackSeconds = Int(elapsed.rounded())
         // Update the current seconds for the progress bar
         currentSeconds = Double(currentPlaybackSeconds)
         
-        if let track = currentTrack, let duration = track.durationSeconds {
+        // Progress, scrobbling and completion all depend on the current track's duration
+        guard let track = currentTrack, let duration = track.durationSeconds else { return }
+        
+        // Only publish the duration when it actually changes, not on every tick
+        if self.duration != Double(duration) {
             self.duration = Double(duration)
         }
         
         // Check for scrobbling threshold (50% of track or 4 minutes)
-        if let track = currentTrack,
-           let duration = track.durationSeconds,
-           shouldScrobble {
+        if shouldScrobble {
             // Only log at significant percentages
             let quarterDuration = duration / 4
             let halfDuration = duration / 2
@@ -271,51 +281,53 @@ class AppState: ObservableObject {
             if currentPlaybackSeconds == quarterDuration ||
                currentPlaybackSeconds == halfDuration ||
                currentPlaybackSeconds == threeQuarterDuration {
-                print("⏱️ Track progress: \(currentPlaybackSeconds)s / \(duration)s")
+                Self.logger.debug("⏱️ Track progress: \(self.currentPlaybackSeconds)s / \(duration)s")
             }
             
             if currentPlaybackSeconds >= halfDuration || currentPlaybackSeconds >= 240 {
-                print("🎵 Scrobble threshold reached (\(currentPlaybackSeconds)s)")
+                Self.logger.info("🎵 Scrobble threshold reached (\(self.currentPlaybackSeconds)s)")
                 scrobbleCurrentTrack()
                 shouldScrobble = false  // Prevent multiple scrobbles of the same track
             }
         }
         
-        // Handle track completion
-        if let track = currentTrack,
-           let duration = track.durationSeconds,
-           currentPlaybackSeconds >= duration {
-            print("✅ Track completed: \(track.title)")
+        // Handle track completion on the same tick, rather than with a separate timer
+        if currentPlaybackSeconds >= duration {
+            Self.logger.info("✅ Track completed: \(track.title)")
             if currentTrackIndex < tracks.count - 1 {
-                nextTrack()
-                startPlayback()  // Ensure playback continues
-                updateNowPlaying()  // Update Now Playing status for the new track
+                nextTrack()  // Restarts playback and updates Now Playing for the new track
             } else {
                 // Stop playback at the end of the album and reset to first track
                 isPlaying = false
                 stopPlayback()
                 
-                // Sort tracks and select the first one
-                let sortedTracks = tracks.sorted { $0.position < $1.position }
-                if let firstTrack = sortedTracks.first {
+                // Select the first track (tracks are kept sorted by position)
+                if let firstTrack = tracks.first {
                     currentTrack = firstTrack
-                    updateCurrentTrackIndex(for: firstTrack)
+                    currentTrackIndex = 0
                 }
             }
         }
     }
     
     /// Updates the "Now Playing" status on Last.fm
+    /// Updates are debounced so skipping through several tracks quickly only
+    /// reports the track the user settles on
     private func updateNowPlaying() {
         guard isAuthenticated, let track = currentTrack else { return }
         
-        Task {
+        nowPlayingTask?.cancel()
+        nowPlayingTask = Task {
             do {
-                print("🎵 Updating Now Playing: \(track.title)")
+                try await Task.sleep(for: nowPlayingDebounce)
+                Self.logger.info("🎵 Updating Now Playing: \(track.title)")
                 try await lastFMService.updateNowPlaying(track: track)
                 sendNowPlayingNotification(for: track)
+            } catch where Task.isCancelled {
+                // Superseded by a newer track change, either while debouncing or
+                // mid-request (URLSession reports that as URLError.cancelled)
             } catch {
-                print("Failed to update Now Playing: \(error.localizedDescription)")
+                Self.logger.error("Failed to update Now Playing: \(error.localizedDescription)")
             }
         }
     }
@@ -326,10 +338,14 @@ class AppState: ObservableObject {
         
         Task {
             do {
-                try await lastFMService.scrobbleTrack(track: track)
-                print("✅ Scrobbled: \(track.title)")
+                switch try await lastFMService.scrobbleTrack(track: track) {
+                case .submitted:
+                    Self.logger.info("✅ Scrobbled: \(track.title)")
+                case .queued:
+                    Self.logger.info("⏳ Scrobble queued for retry: \(track.title)")
+                }
             } catch {
-                print("❌ Scrobble failed: \(error.localizedDescription)")
+                Self.logger.error("❌ Scrobble failed: \(error.localizedDescription)")
             }
         }
     }
@@ -357,7 +373,7 @@ class AppState: ObservableObject {
         do {
             lastFMUser = try await lastFMService.getUserInfo()
         } catch {
-            print("Failed to fetch user info: \(error.localizedDescription)")
+            Self.logger.error("Failed to fetch user info: \(error.localizedDescription)")
             lastFMUser = nil
         }
     }
@@ -371,7 +387,9 @@ class AppState: ObservableObject {
         showAbout = false
         showListen = false
         
-        // Then clear the session
+        // Then clear the session, dropping any pending Now Playing update
+        nowPlayingTask?.cancel()
+        nowPlayingTask = nil
         lastFMService.clearSession()
         
         // Finally update the authentication state
@@ -417,9 +435,8 @@ class AppState: ObservableObject {
     
     /// Updates the current track index based on the track's position
     private func updateCurrentTrackIndex(for track: Track) {
-        let sortedTracks = tracks.sorted { $0.position < $1.position }
-        if let index = sortedTracks.firstIndex(where: { $0.position == track.position }) {
-            currentTrackIndex = tracks.firstIndex(where: { $0.position == sortedTracks[index].position }) ?? 0
+        if let index = tracks.firstIndex(where: { $0.position == track.position }) {
+            currentTrackIndex = index
         }
     }
     
@@ -445,25 +462,32 @@ class AppState: ObservableObject {
             return
         }
         
-        print("🎵 Starting to load release: \(release.title)")
-        tracks.removeAll()
+        Self.logger.info("🎵 Starting to load release: \(release.title)")
+        // Build the track list locally and publish it once at the end
+        var loadedTracks: [Track] = []
+        loadedTracks.reserveCapacity(release.tracklist.count)
+        
+        // Release-level metadata is the same for every track
+        let artist = release.artists.first?.cleanName ?? ""
+        let album = release.title
         
         for trackInfo in release.tracklist {
             // Skip entries that are side titles (have no position)
             guard !trackInfo.position.isEmpty else {
-                print("⚠️ Skipping side title: \(trackInfo.title)")
+                Self.logger.debug("⚠️ Skipping side title: \(trackInfo.title)")
                 continue
             }
             
-            print("📝 Processing track: \(trackInfo.title) (Position: \(trackInfo.position))")
+            Self.logger.debug("📝 Processing track: \(trackInfo.title) (Position: \(trackInfo.position))")
             
-            // Step 1: Check Discogs duration
+            // Step 1: Check Discogs duration, parsing it once to make sure it is usable
             var finalDuration: String? = nil
-            if let discogsTrackDuration = trackInfo.duration, !discogsTrackDuration.isEmpty {
-                print("✅ Found Discogs duration for '\(trackInfo.title)': \(discogsTrackDuration)")
+            if let discogsTrackDuration = trackInfo.duration,
+               Track.seconds(from: discogsTrackDuration) != nil {
+                Self.logger.debug("✅ Found Discogs duration for '\(trackInfo.title)': \(discogsTrackDuration)")
                 finalDuration = discogsTrackDuration
             } else {
-                print("ℹ️ No Discogs duration for '\(trackInfo.title)', will use default 3:00")
+                Self.logger.debug("ℹ️ No valid Discogs duration for '\(trackInfo.title)', will use default 3:00")
                 finalDuration = "3:00"
             }
             
@@ -471,12 +495,12 @@ class AppState: ObservableObject {
                 position: trackInfo.position,
                 title: trackInfo.title,
                 duration: finalDuration,
-                artist: release.artists.first?.name ?? "",
-                album: release.title,
+                artist: artist,
+                album: album,
                 artworkURL: nil  // We'll set this later when we get LastFM data
             )
             
-            print("""
+            Self.logger.debug("""
                 ✅ Added track:
                    Position: \(track.position)
                    Title: \(track.title)
@@ -484,11 +508,12 @@ class AppState: ObservableObject {
                    Artist: \(track.artist)
                 """)
             
-            tracks.append(track)
+            loadedTracks.append(track)
         }
         
-        // Sort tracks and setup initial state
-        tracks.sort { $0.position < $1.position }
+        // Sort tracks once here; playback navigation relies on this order
+        loadedTracks.sort { $0.position < $1.position }
+        tracks = loadedTracks
         
         if let firstTrack = tracks.first {
             currentTrack = firstTrack
@@ -499,7 +524,7 @@ class AppState: ObservableObject {
         currentPlaybackSeconds = 0
         shouldScrobble = true
         
-        print("✅ Loaded release: \(release.title) with \(tracks.count) tracks")
+        Self.logger.info("✅ Loaded release: \(release.title) with \(self.tracks.count) tracks")
         
         // After initial load, try to fetch Last.fm durations
         Task {
@@ -518,23 +543,20 @@ class AppState: ObservableObject {
     ///    - If not available, try Last.fm duration
     ///    - If neither available, default to 3:00
     private func updateTracksWithLastFMDurations(release: DiscogsRelease) async {
-        guard let artist = release.artists.first?.name else { return }
+        guard let artist = release.artists.first?.cleanName else { return }
         
-        print("🔄 Fetching metadata for \(release.title)")
+        Self.logger.info("🔄 Fetching metadata for \(release.title)")
         
         // Function to update all tracks with new artwork
         @Sendable func updateTracksWithArtwork(_ url: URL) async {
             await MainActor.run {
-                for (index, track) in tracks.enumerated() {
-                    tracks[index] = Track(
-                        position: track.position,
-                        title: track.title,
-                        duration: track.duration,
-                        artist: track.artist,
-                        album: track.album,
-                        artworkURL: url
-                    )
+                // Update artwork in place so tracks keep their identity and the
+                // list isn't rebuilt; assign once to publish a single change
+                var updatedTracks = tracks
+                for index in updatedTracks.indices {
+                    updatedTracks[index].artworkURL = url
                 }
+                tracks = updatedTracks
                 // Update current track if needed
                 if let currentIndex = tracks.firstIndex(where: { $0.position == currentTrack?.position }) {
                     currentTrack = tracks[currentIndex]
@@ -542,6 +564,15 @@ class AppState: ObservableObject {
             }
         }
         
+        // Request the Last.fm album info up front so it loads while Apple Music is
+        // being queried; the artwork fallback and the duration update share it
+        let albumInfoTask = Task {
+            try await LastFMService.shared.getAlbumInfo(
+                artist: artist,
+                album: release.title
+            )
+        }
+        
         // Start artwork and duration updates in parallel
         async let artworkResult: Void = {
             // Try Apple Music first
@@ -550,84 +581,80 @@ class AppState: ObservableObject {
                     artist: artist,
                     album: release.title
                 ) {
-                    print("✅ Using Apple Music high-quality artwork")
+                    Self.logger.info("✅ Using Apple Music high-quality artwork")
                     await updateTracksWithArtwork(url)
                     return
                 }
             } catch {
-                print("⚠️ Failed to get Apple Music artwork: \(error.localizedDescription)")
+                Self.logger.warning("⚠️ Failed to get Apple Music artwork: \(error.localizedDescription)")
             }
             
             // Try Last.fm artwork
             do {
-                let lastFmAlbumInfo = try await LastFMService.shared.getAlbumInfo(
-                    artist: artist,
-                    album: release.title
-                )
+                let lastFmAlbumInfo = try await albumInfoTask.value
                 
                 if let images = lastFmAlbumInfo.images {
-                    if let extraLargeImage = images.first(where: { $0.size == "extralarge" }),
-                       let url = URL(string: extraLargeImage.url) {
-                        print("✅ Using Last.fm extra large artwork")
-                        await updateTracksWithArtwork(url)
-                        return
-                    } else if let largeImage = images.first(where: { $0.size == "large" }),
-                              let url = URL(string: largeImage.url) {
-                        print("✅ Using Last.fm large artwork")
-                        await updateTracksWithArtwork(url)
-                        return
+                    // Take the largest preferred size available
+                    for size in Self.lastFMArtworkSizes {
+                        if let image = images.first(where: { $0.size == size }), let url = URL(string: image.url) {
+                            Self.logger.info("✅ Using Last.fm \(size) artwork")
+                            await updateTracksWithArtwork(url)
+                            return
+                        }
                     }
                 }
             } catch {
-                print("⚠️ Failed to get Last.fm artwork: \(error.localizedDescription)")
+                Self.logger.warning("⚠️ Failed to get Last.fm artwork: \(error.localizedDescription)")
             }
             
             // Fallback to Discogs artwork
             if let firstImage = release.images?.first,
                let url = URL(string: firstImage.uri) {
-                print("ℹ️ Using Discogs artwork")
+                Self.logger.info("ℹ️ Using Discogs artwork")
                 await updateTracksWithArtwork(url)
             }
         }()
         
         async let durationsResult: Void = {
             do {
-                let lastFmAlbumInfo = try await LastFMService.shared.getAlbumInfo(
-                    artist: artist,
-                    album: release.title
+                let lastFmAlbumInfo = try await albumInfoTask.value
+                
+                // Index Last.fm durations by lowercased track name once, rather than
+                // lowercasing and scanning every Last.fm track for each album track
+                let lastFmDurations = Dictionary(
+                    lastFmAlbumInfo.tracks.map { ($0.name.lowercased(), $0.duration) },
+                    uniquingKeysWith: { first, _ in first }
                 )
                 
                 await MainActor.run {
-                    // Update durations from Last.fm
-                    for (index, track) in tracks.enumerated() {
-                        var finalDuration = track.duration
-                        if finalDuration == nil || finalDuration == "3:00" {
-                            if let lastFmTrack = lastFmAlbumInfo.tracks.first(where: { $0.name.lowercased() == track.title.lowercased() }),
-                               let duration = lastFmTrack.duration {
-                                finalDuration = duration
-                                print("✅ Updated duration for '\(track.title)' with Last.fm duration: \(duration)")
-                                
-                                tracks[index] = Track(
-                                    position: track.position,
-                                    title: track.title,
-                                    duration: finalDuration,
-                                    artist: track.artist,
-                                    album: track.album,
-                                    artworkURL: track.artworkURL
-                                )
+                    // Update durations from Last.fm in place so tracks keep their
+                    // identity, and publish the list once only if something changed
+                    var updatedTracks = tracks
+                    var didUpdateDurations = false
+                    for index in updatedTracks.indices {
+                        let track = updatedTracks[index]
+                        if track.duration == nil || track.duration == "3:00" {
+                            if let duration = lastFmDurations[track.title.lowercased()] ?? nil,
+                               duration != track.duration {
+                                Self.logger.debug("✅ Updated duration for '\(track.title)' with Last.fm duration: \(duration)")
+                                updatedTracks[index].duration = duration
+                                didUpdateDurations = true
                             }
                         } else {
-                            print("ℹ️ Using Discogs duration for '\(track.title)': \(finalDuration ?? "unknown")")
+                            Self.logger.debug("ℹ️ Using Discogs duration for '\(track.title)': \(track.duration ?? "unknown")")
                         }
                     }
                     
+                    guard didUpdateDurations else { return }
+                    tracks = updatedTracks
+                    
                     // Update current track if needed
                     if let currentIndex = tracks.firstIndex(where: { $0.position == currentTrack?.position }) {
                         currentTrack = tracks[currentIndex]
                     }
                 }
             } catch {
-                print("❌ Failed to get Last.fm durations: \(error.localizedDescription)")
+                Self.logger.error("❌ Failed to get Last.fm durations: \(error.localizedDescription)")
             }
         }()
         
@@ -639,7 +666,7 @@ class AppState: ObservableObject {
     func toggleWindowVisibility() {
         windowVisible.toggle()
         showPlayer = windowVisible
-        print("🔄 Window visibility toggled: \(windowVisible ? "visible" : "hidden")")
+        Self.logger.debug("🔄 Window visibility toggled: \(self.windowVisible ? "visible" : "hidden")")
     }
     
     // MARK: - Computed Properties
@@ -670,8 +697,9 @@ class AppState: ObservableObject {
         content.title = "Now Playing"
         content.body = "\(track.title) by \(track.artist)"
         
+        notificationCounter += 1
         let request = UNNotificationRequest(
-            identifier: UUID().uuidString,
+            identifier: "now-playing-\(notificationCounter)",
             content: content,
             trigger: nil
         )
@@ -27,6 +27,22 @@ struct DiscogsRelease: Codable {
     struct Artist: Codable {
         /// Name of the artist
         let name: String
+        
+        /// Matches the numeric suffix Discogs adds to disambiguate artists, e.g. " (2)"
+        /// Compiled once and shared, as it runs for every release that is loaded
+        private static let disambiguationSuffix = try? NSRegularExpression(pattern: "\\s*\\(\\d+\\)\\s*$")
+        
+        /// Name of the artist without the Discogs disambiguation suffix
+        /// Example: "Nirvana (2)" returns "Nirvana"
+        var cleanName: String {
+            guard let regex = Self.disambiguationSuffix else { return name }
+            return regex.stringByReplacingMatches(
+                in: name,
+                options: [],
+                range: NSRange(name.startIndex..., in: name),
+                withTemplate: ""
+            )
+        }
     }
     
     /// Represents a single track from the release
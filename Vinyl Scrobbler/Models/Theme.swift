@@ -182,18 +182,26 @@ extension Color: Codable {
     }
 }
 
-// MARK: - Preview Helper
+// MARK: - Bundled Theme
 extension Theme {
-    /// Provides a preview theme for SwiftUI previews
-    /// Loads the theme from the bundled ColorTheme.json file
-    /// - Returns: A Theme instance for preview purposes
+    /// The theme decoded from the bundled ColorTheme.json file
+    /// Decoded once on first access and shared by every AppState and preview
     /// - Fatal Error: If the theme file cannot be loaded or decoded
-    static var preview: Theme {
+    static let bundled: Theme = {
         guard let url = Bundle.main.url(forResource: "ColorTheme", withExtension: "json"),
               let data = try? Data(contentsOf: url),
               let theme = try? JSONDecoder().decode(Theme.self, from: data) else {
-            fatalError("Failed to load preview theme")
+            fatalError("Failed to load theme configuration")
         }
         return theme
+    }()
+}
+
+// MARK: - Preview Helper
+extension Theme {
+    /// Provides a preview theme for SwiftUI previews
+    /// - Returns: The bundled Theme instance for preview purposes
+    static var preview: Theme {
+        bundled
     }
 }
\ No newline at end of file
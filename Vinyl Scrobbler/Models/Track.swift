@@ -21,7 +21,9 @@ public struct Track: Identifiable, Equatable {
     /// The duration of the track in MM:SS format
     /// Optional as some track listings might not include duration information
     /// Example: "3:45" represents 3 minutes and 45 seconds
-    public var duration: String?
+    public var duration: String? {
+        didSet { durationSeconds = duration.flatMap(Track.seconds(from:)) }
+    }
     
     /// The name of the artist or band who performed the track
     /// This might differ from the album artist in compilation albums
@@ -36,20 +38,43 @@ public struct Track: Identifiable, Equatable {
     /// When present, can be used to fetch and display album cover art
     public var artworkURL: URL?
     
-    // MARK: - Computed Properties
-    /// Converts the MM:SS duration string into total seconds
-    /// Useful for playback timing and duration calculations
-    /// - Returns: Total number of seconds for the track duration, or nil if duration is missing or invalid
-    /// - Example: "3:45" returns 225 (3 minutes * 60 + 45 seconds)
-    public var durationSeconds: Int? {
-        guard let duration = duration else { return nil }
-        let components = duration.split(separator: ":")
-        guard components.count == 2,
-              let minutes = Int(components[0]),
-              let seconds = Int(components[1]) else {
-            return nil
+    /// The MM:SS (or H:MM:SS) duration converted into total seconds
+    /// Parsed once when the duration is set, as playback reads it on every tick
+    /// nil if duration is missing or invalid
+    /// - Example: "3:45" gives 225 (3 minutes * 60 + 45 seconds)
+    public private(set) var durationSeconds: Int?
+    
+    // MARK: - Duration Parsing
+    /// Parses a duration string in M:SS or H:MM:SS format into total seconds
+    /// Walks the UTF-8 bytes once, folding each colon-separated field into the total,
+    /// instead of splitting the string and converting each component separately
+    /// - Parameter duration: Duration string such as "3:45" or "1:02:30"
+    /// - Returns: Total number of seconds, or nil if the string is not a valid duration
+    public static func seconds(from duration: String) -> Int? {
+        var total = 0
+        var field = 0
+        var fieldDigits = 0
+        var fieldCount = 1
+        
+        for byte in duration.utf8 {
+            switch byte {
+            case UInt8(ascii: "0")...UInt8(ascii: "9"):
+                guard fieldDigits < 6 else { return nil }
+                field = field * 10 + Int(byte &- UInt8(ascii: "0"))
+                fieldDigits += 1
+            case UInt8(ascii: ":"):
+                guard fieldDigits > 0, fieldCount < 3 else { return nil }
+                total = (total + field) * 60
+                field = 0
+                fieldDigits = 0
+                fieldCount += 1
+            default:
+                return nil
+            }
         }
-        return minutes * 60 + seconds
+        
+        guard fieldDigits > 0, fieldCount > 1 else { return nil }
+        return total + field
     }
     
     // MARK: - Initialization
@@ -65,6 +90,7 @@ public struct Track: Identifiable, Equatable {
         self.position = position
         self.title = title
         self.duration = duration
+        self.durationSeconds = duration.flatMap(Track.seconds(from:))
         self.artist = artist
         self.album = album
         self.artworkURL = artworkURL
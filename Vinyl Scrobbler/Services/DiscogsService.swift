@@ -15,27 +15,21 @@ class DiscogsService {
     /// URLSession instance configured with Discogs API headers
     private let session: URLSession
     
-    /// JSON decoder configured for Discogs API response format
-    private let decoder: JSONDecoder
-    
-    /// User agent string identifying the app to Discogs API
-    private let userAgent = "VinylScrobbler/1.0 +https://www.vinyl-scrobbler.app/"
-    
     /// Reference to the app's state for updating UI-related information
     private var appState: AppState?
     
+    /// On-disk cache of release responses, kept for 24 hours
+    private let releaseCache = ResponseCache(name: "DiscogsReleases", maxAge: 24 * 60 * 60)
+    
     /// Private initializer to enforce singleton pattern
-    /// Sets up URLSession with required headers and configures JSON decoder
+    /// Sets up URLSession with required headers
     private init() {
         let config = URLSessionConfiguration.default
         config.httpAdditionalHeaders = [
-            "User-Agent": userAgent,
+            "User-Agent": AppConfig.userAgent,
             "Authorization": "Discogs token=\(SecureConfig.discogsToken ?? "")"
         ]
         session = URLSession(configuration: config)
-        
-        decoder = JSONDecoder()
-        decoder.keyDecodingStrategy = .convertFromSnakeCase
     }
     
     /// Configures the service with a reference to the app's state
@@ -44,13 +38,36 @@ class DiscogsService {
         self.appState = appState
     }
     
+    /// Decodes a Discogs API response off the main actor
+    /// Release tracklists and search pages can be large, so decoding them on the
+    /// main actor would stall the UI while a release loads
+    /// - Parameters:
+    ///   - type: The response type to decode
+    ///   - data: The raw response body
+    /// - Returns: The decoded response
+    nonisolated private static func decode<T: Decodable & Sendable>(_ type: T.Type, from data: Data) async throws -> T {
+        let decoder = JSONDecoder()
+        decoder.keyDecodingStrategy = .convertFromSnakeCase
+        return try decoder.decode(type, from: data)
+    }
+    
     // MARK: - API Methods
     
     /// Fetches detailed information about a specific release from Discogs
+    /// Responses are cached on disk for 24 hours, so reloading a recent release
+    /// doesn't hit the network
     /// - Parameter id: The Discogs release ID to fetch
     /// - Returns: A DiscogsRelease object containing the release details
     /// - Throws: DiscogsError if the request fails or response is invalid
     func loadRelease(_ id: Int) async throws -> DiscogsRelease {
+        let cacheKey = String(id)
+        if let cachedData = await releaseCache.data(forKey: cacheKey),
+           let release = try? await Self.decode(DiscogsRelease.self, from: cachedData) {
+            logger.info("📦 Using cached Discogs release: \(id)")
+            appState?.discogsURI = release.uri
+            return release
+        }
+        
         let url = URL(string: "https://api.discogs.com/releases/\(id)")!
         
         logger.info("🎵 Fetching Discogs release: \(id)")
@@ -74,7 +91,8 @@ class DiscogsService {
         }
         
         do {
-            let release = try decoder.decode(DiscogsRelease.self, from: data)
+            let release = try await Self.decode(DiscogsRelease.self, from: data)
+            await releaseCache.store(data, forKey: cacheKey)
             
             // Set the Discogs URI in AppState
             appState?.discogsURI = release.uri
@@ -106,9 +124,7 @@ class DiscogsService {
             return release
         } catch let decodingError as DecodingError {
             logger.error("❌ Failed to decode Discogs response: \(decodingError)")
-            if let dataString = String(data: data, encoding: .utf8) {
-                logger.debug("Response data: \(dataString)")
-            }
+            logger.debug("Response data: \(String(decoding: data, as: UTF8.self))")
             throw DiscogsError.decodingError(decodingError)
         } catch {
             logger.error("❌ Network error loading release: \(error.localizedDescription)")
@@ -179,10 +195,8 @@ class DiscogsService {
             artist.map(Self.cleanupTitle)
         }
         
-        /// Removes common suffixes and extra information from titles
-        /// - Parameter title: The title to clean
-        /// - Returns: A cleaned version of the title
-        private static func cleanupTitle(_ title: String) -> String {
+        /// Suffix patterns stripped from titles, compiled once and applied in order
+        private static let suffixRegexes: [NSRegularExpression] = {
             // Common suffixes to remove
             let suffixesToRemove = [
                 "(Remastered)",
@@ -202,17 +216,25 @@ class DiscogsService {
                 "- Remastered \\d{4}",  // e.g., - Remastered 2015
             ]
             
+            return suffixesToRemove.compactMap {
+                try? NSRegularExpression(pattern: $0 + "\\s*$", options: [.caseInsensitive])
+            }
+        }()
+        
+        /// Removes common suffixes and extra information from titles
+        /// - Parameter title: The title to clean
+        /// - Returns: A cleaned version of the title
+        private static func cleanupTitle(_ title: String) -> String {
             var cleanTitle = title
             
             // Remove each suffix pattern
-            for suffix in suffixesToRemove {
-                let regex = try? NSRegularExpression(pattern: suffix + "\\s*$", options: [.caseInsensitive])
-                cleanTitle = regex?.stringByReplacingMatches(
+            for regex in suffixRegexes {
+                cleanTitle = regex.stringByReplacingMatches(
                     in: cleanTitle,
                     options: [],
                     range: NSRange(cleanTitle.startIndex..., in: cleanTitle),
                     withTemplate: ""
-                ) ?? cleanTitle
+                )
             }
             
             return cleanTitle.trimmingCharacters(in: .whitespacesAndNewlines)
@@ -286,13 +308,11 @@ class DiscogsService {
         }
         
         do {
-            return try decoder.decode(DiscogsSearchResponse.self, from: data)
+            return try await Self.decode(DiscogsSearchResponse.self, from: data)
         } catch {
             logger.error("Failed to decode Discogs search response: \(error.localizedDescription)")
             logger.error("Error details: \(error)")
-            if let dataString = String(data: data, encoding: .utf8) {
-                logger.debug("Response data: \(dataString)")
-            }
+            logger.debug("Response data: \(String(decoding: data, as: UTF8.self))")
             throw DiscogsError.decodingError(error)
         }
     }
@@ -312,23 +332,28 @@ class DiscogsService {
     /// - Parameter input: The input string to parse
     /// - Returns: The extracted release ID
     /// - Throws: DiscogsError if the input format is invalid
-    func extractReleaseId(from input: String) async throws -> Int {
-        // First try to parse as a direct ID
-        if let id = Int(input) {
+    func extractReleaseId(from rawInput: String) async throws -> Int {
+        let input = rawInput.trimmingCharacters(in: .whitespacesAndNewlines)
+        
+        // First try to parse as a direct ID (bounded length, digits only)
+        if !input.isEmpty, input.utf8.count <= 12,
+           input.utf8.allSatisfy({ $0 >= UInt8(ascii: "0") && $0 <= UInt8(ascii: "9") }),
+           let id = Int(input) {
             return id
         }
         
         // Check for [r123456] format
-        if input.hasPrefix("[r") && input.hasSuffix("]") {
-            let start = input.index(input.startIndex, offsetBy: 2)
-            let end = input.index(input.endIndex, offsetBy: -1)
-            let releaseId = String(input[start..<end])
-            if let id = Int(releaseId) {
-                return id
-            }
+        if input.hasPrefix("[r") && input.hasSuffix("]"),
+           let id = Int(input.dropFirst(2).dropLast()) {
+            return id
+        }
+        
+        // Anything else must be a URL; input without a path can't hold a release ID,
+        // so skip URL parsing for it
+        guard input.contains("/") else {
+            throw DiscogsError.invalidInput("Could not find release ID in URL")
         }
         
-        // Try to parse as URL
         guard let url = URL(string: input) else {
             throw DiscogsError.invalidInput("Invalid URL or release ID format")
         }
@@ -345,97 +370,6 @@ class DiscogsService {
         
         throw DiscogsError.invalidInput("Could not find release ID in URL")
     }
-    
-    /// Creates Track objects from a Discogs release
-    /// Attempts to enhance track information with Last.fm data
-    /// - Parameter release: The DiscogsRelease to process
-    /// - Returns: An array of Track objects
-    private func createTracks(from release: DiscogsRelease) async throws -> [Track] {
-        var tracks: [Track] = []
-        logger.info("🎼 Processing Discogs release: \(release.title)")
-        
-        // Try to get Last.fm album info first for artwork and track durations
-        var lastFmAlbumInfo: AlbumInfo? = nil
-        if let artist = release.artists.first?.name {
-            do {
-                lastFmAlbumInfo = try await LastFMService.shared.getAlbumInfo(
-                    artist: artist,
-                    album: release.title
-                )
-                logger.info("✅ Got Last.fm album info with \(lastFmAlbumInfo?.tracks.count ?? 0) tracks")
-            } catch {
-                logger.error("❌ Failed to get Last.fm album info: \(error.localizedDescription)")
-            }
-        }
-        
-        // Process tracks
-        logger.info("🔍 Starting track processing - Total tracks in release: \(release.tracklist.count)")
-        for (index, trackInfo) in release.tracklist.enumerated() {
-            logger.info("""
-                📝 Examining track \(index + 1):
-                - Title: \(trackInfo.title)
-                - Position: '\(trackInfo.position)'
-                - Type: \(trackInfo.type ?? "nil")
-                - Duration: \(trackInfo.duration ?? "nil")
-                """)
-            
-            // Skip entries that are side titles (have no position and type is "heading" or empty)
-            if trackInfo.position.isEmpty {
-                logger.info("⚠️ Skipping track '\(trackInfo.title)' - Empty position")
-                continue
-            }
-            
-            // Step 1: Try to get duration from Discogs
-            var finalDuration: String? = nil
-            if let discogsTrackDuration = trackInfo.duration, !discogsTrackDuration.isEmpty {
-                logger.info("✅ Using Discogs duration: \(discogsTrackDuration)")
-                finalDuration = discogsTrackDuration
-            }
-            
-            // Step 2: If no Discogs duration, try to find matching track in Last.fm data
-            if finalDuration == nil, let lastFmAlbumInfo = lastFmAlbumInfo {
-                // Try to find matching track by title
-                if let matchingLastFmTrack = lastFmAlbumInfo.tracks.first(where: { $0.name.lowercased() == trackInfo.title.lowercased() }) {
-                    finalDuration = matchingLastFmTrack.duration
-                    logger.info("✅ Found matching Last.fm duration: \(finalDuration ?? "nil")")
-                } else {
-                    // Fallback to index-based matching if titles don't match exactly
-                    if lastFmAlbumInfo.tracks.indices.contains(index) {
-                        finalDuration = lastFmAlbumInfo.tracks[index].duration
-                        logger.info("⚠️ Using Last.fm duration by track position: \(finalDuration ?? "nil")")
-                    }
-                }
-            }
-            
-            // Step 3: If still no duration, use default
-            if finalDuration == nil {
-                finalDuration = "3:00"
-                logger.info("⚠️ No duration found, using default: 3:00")
-            }
-            
-            let track = Track(
-                position: trackInfo.position,
-                title: trackInfo.title,
-                duration: finalDuration,
-                artist: release.artists.first?.name ?? "",
-                album: release.title,
-                artworkURL: nil
-            )
-            
-            logger.info("""
-                ✅ Added track:
-                - Position: \(track.position)
-                - Title: \(track.title)
-                - Duration: \(track.duration ?? "3:00") \(finalDuration == "3:00" ? "(default)" : "")
-                - Artist: \(track.artist)
-                """)
-            
-            tracks.append(track)
-        }
-        
-        logger.info("✨ Finished processing - Added \(tracks.count) tracks")
-        return tracks
-    }
 }
 
 // MARK: - Error Handling
@@ -147,15 +147,22 @@ struct AlbumTrack: Codable {
         let container = try decoder.container(keyedBy: CodingKeys.self)
         name = try container.decode(String.self, forKey: .name)
         if let durationSeconds = try container.decodeIfPresent(Int.self, forKey: .duration), durationSeconds > 0 {
-            let minutes = durationSeconds / 60
-            let seconds = durationSeconds % 60
-            duration = String(format: "%d:%02d", minutes, seconds)
+            let (minutes, seconds) = durationSeconds.quotientAndRemainder(dividingBy: 60)
+            duration = "\(minutes):\(seconds < 10 ? "0" : "")\(seconds)"
         } else {
             duration = "3:00"  // Default duration if not provided
         }
     }
 }
 
+/// Outcome of scrobbling a track
+enum ScrobbleStatus {
+    /// Last.fm accepted the scrobble
+    case submitted
+    /// The scrobble is queued and will be submitted with a later flush
+    case queued
+}
+
 // MARK: - Last.fm Service
 
 /// Main service class for Last.fm API interactions
@@ -165,15 +172,64 @@ class LastFMService {
     static let shared = LastFMService()
     /// Logger for debugging and error tracking
     private let logger = Logger(subsystem: "com.vinyl.scrobbler", category: "LastFMService")
-    /// URL session for API requests
+    /// URL session for API requests, reused across calls so connections stay alive
     private let session: URLSession
     /// ScrobbleKit manager instance
     private var manager: SBKManager?
+    /// Maximum number of scrobbles Last.fm accepts in a single request
+    private let maxScrobbleBatchSize = 50
+    /// Maximum number of scrobbles kept while waiting to be submitted
+    private let maxPendingScrobbles = 500
+    /// Age after which Last.fm ignores a scrobble, so it is no longer worth queueing
+    private let maxPendingScrobbleAge: TimeInterval = 14 * 24 * 60 * 60
+    /// UserDefaults key used to persist scrobbles that have not been submitted yet
+    private let pendingScrobblesKey = "pendingScrobbles"
+    /// Scrobbles waiting to be submitted, oldest first
+    private var pendingScrobbles: [PendingScrobble] = []
+    /// Whether a batch submission is currently in flight
+    private var isFlushingScrobbles = false
+    /// Maximum number of albums kept in the album info cache
+    private let maxCachedAlbums = 50
+    /// How long a cached album info response stays valid
+    private let albumInfoMaxAge: TimeInterval = 24 * 60 * 60
+    /// Album info responses and the time they were fetched, keyed by artist and album
+    private var albumInfoCache: [String: (info: AlbumInfo, fetchedAt: Date)] = [:]
+    /// Album info cache keys ordered from least to most recently used
+    private var albumInfoCacheOrder: [String] = []
+    /// Album info requests currently in flight, shared by concurrent callers
+    private var albumInfoTasks: [String: Task<(info: AlbumInfo, fetchedAt: Date), Error>] = [:]
+    /// On-disk cache of album info responses, kept as long as in-memory entries
+    private let albumInfoDiskCache = ResponseCache(name: "LastFMAlbums", maxAge: 24 * 60 * 60)
+    
+    /// A scrobble queued for submission to Last.fm
+    private struct PendingScrobble: Codable {
+        let artist: String
+        let track: String
+        let album: String
+        let duration: Int
+        let timestamp: Date
+        
+        /// The ScrobbleKit representation of this scrobble
+        var sbkTrack: SBKTrackToScrobble {
+            SBKTrackToScrobble(
+                artist: artist,
+                track: track,
+                timestamp: timestamp,
+                album: album,
+                duration: duration
+            )
+        }
+    }
     
     /// Private initializer to enforce singleton pattern
+    /// Sets up a single URLSession shared by all direct Last.fm API calls
     private init() {
         let config = URLSessionConfiguration.default
+        config.httpAdditionalHeaders = [
+            "User-Agent": AppConfig.userAgent
+        ]
         session = URLSession(configuration: config)
+        loadPendingScrobbles()
         setupScrobbleKit()
     }
     
@@ -193,6 +249,7 @@ class LastFMService {
         if let sessionKey = getStoredSessionKey() {
             manager?.setSessionKey(sessionKey)
             logger.info("Loaded existing Last.fm session key from keychain")
+            resumePendingScrobbles()
         }
     }
     
@@ -215,6 +272,7 @@ class LastFMService {
             manager.setSessionKey(response.key)
             
             logger.info("Authentication successful")
+            resumePendingScrobbles()
         } catch {
             logger.error("Authentication failed: \(error.localizedDescription)")
             throw error
@@ -248,14 +306,18 @@ class LastFMService {
     // MARK: - Scrobbling
     
     /// Scrobbles a track to Last.fm
+    /// The track is queued together with any scrobbles that previously failed to
+    /// submit, and the queue is flushed in batches of up to 50 tracks per request
     /// - Parameter track: The track to scrobble
-    /// - Throws: LastFMError if scrobbling fails
-    public func scrobbleTrack(track: Track) async throws {
-        guard let manager = manager else {
+    /// - Returns: Whether the scrobble was submitted or is still queued for a later retry
+    /// - Throws: LastFMError if the scrobble was rejected by Last.fm
+    @discardableResult
+    public func scrobbleTrack(track: Track) async throws -> ScrobbleStatus {
+        guard manager != nil else {
             throw LastFMError.configurationMissing
         }
         
-        let durationInSeconds = convertDurationToSeconds(track.duration)
+        let durationInSeconds = track.durationSeconds
         
         logger.debug("""
             📝 Preparing to scrobble track:
@@ -265,40 +327,168 @@ class LastFMService {
             Duration: \(track.duration ?? "unknown") (\(String(describing: durationInSeconds)) seconds)
             """)
         
-        do {
-            let sbkTrack = SBKTrackToScrobble(
-                artist: track.artist,
-                track: track.title,
-                timestamp: Date(),
-                album: track.album,
-                duration: durationInSeconds ?? 0
-            )
-            
-            let response = try await manager.scrobble(tracks: [sbkTrack])
+        let scrobble = PendingScrobble(
+            artist: track.artist,
+            track: track.title,
+            album: track.album,
+            duration: durationInSeconds ?? 0,
+            timestamp: Date()
+        )
+        pendingScrobbles.append(scrobble)
+        savePendingScrobbles()
+        
+        // Failures that keep the queue are logged by the flush; the track stays queued
+        guard let rejectedTimestamps = try? await flushPendingScrobbles() else {
+            return .queued
+        }
+        
+        if rejectedTimestamps.contains(scrobble.timestamp) {
+            throw LastFMError.invalidResponse
+        }
+        
+        // A flush that was already running may not have reached this scrobble yet
+        return pendingScrobbles.contains { $0.timestamp == scrobble.timestamp } ? .queued : .submitted
+    }
+    
+    /// Submits queued scrobbles to Last.fm in batches
+    /// Scrobbles stay queued (and persisted) if the request fails for a reason that
+    /// applies to every request, such as a network error or an expired session, so
+    /// they are retried later instead of being lost. If Last.fm rejects a batch
+    /// because of its contents, its scrobbles are resent one at a time so only the
+    /// ones Last.fm refuses are dropped
+    /// - Returns: Timestamps of the scrobbles Last.fm rejected
+    /// - Throws: The underlying error if the queue was kept for a later retry
+    @discardableResult
+    private func flushPendingScrobbles() async throws -> Set<Date> {
+        guard let manager = manager else {
+            throw LastFMError.configurationMissing
+        }
+        
+        // A flush already in progress will pick up newly queued scrobbles
+        guard !isFlushingScrobbles else { return [] }
+        isFlushingScrobbles = true
+        defer { isFlushingScrobbles = false }
+        
+        prunePendingScrobbles()
+        
+        var rejectedTimestamps: Set<Date> = []
+        // Scrobbles from a rejected batch that are still to be resent one at a time
+        var remainingIndividualScrobbles = 0
+        
+        while !pendingScrobbles.isEmpty {
+            let batchSize = remainingIndividualScrobbles > 0 ? 1 : maxScrobbleBatchSize
+            let batch = Array(pendingScrobbles.prefix(batchSize))
+            let batchTimestamps = Set(batch.map(\.timestamp))
             
-            if response.isCompletelySuccessful {
-                logger.info("✅ Track successfully submitted to Last.fm")
-            } else if let result = response.results.first {
-                if result.isAccepted {
-                    var correctionLog = ["🔄 Track scrobbled with the following corrections:"]
-                    if let correctedArtist = result.correctedArtist {
-                        correctionLog.append("- Artist corrected to: \(correctedArtist)")
-                    }
-                    if let correctedTrack = result.correctedTrack {
-                        correctionLog.append("- Track corrected to: \(correctedTrack)")
+            do {
+                let response = try await manager.scrobble(tracks: batch.map(\.sbkTrack))
+                
+                // Remove by identity, as the queue may have been cleared while the request was in flight
+                pendingScrobbles.removeAll { batchTimestamps.contains($0.timestamp) }
+                savePendingScrobbles()
+                
+                if response.isCompletelySuccessful {
+                    logger.info("✅ \(batch.count) track(s) successfully submitted to Last.fm")
+                } else {
+                    for (scrobble, result) in zip(batch, response.results) {
+                        if result.isAccepted {
+                            var correctionLog = ["🔄 '\(scrobble.track)' scrobbled with the following corrections:"]
+                            if let correctedArtist = result.correctedArtist {
+                                correctionLog.append("- Artist corrected to: \(correctedArtist)")
+                            }
+                            if let correctedTrack = result.correctedTrack {
+                                correctionLog.append("- Track corrected to: \(correctedTrack)")
+                            }
+                            if let correctedAlbum = result.correctedAlbum {
+                                correctionLog.append("- Album corrected to: \(correctedAlbum)")
+                            }
+                            logger.info("\(correctionLog.joined(separator: "\n"))")
+                        } else if let error = result.error {
+                            logger.error("❌ Scrobble of '\(scrobble.track)' rejected by Last.fm: \(error.rawValue)")
+                            rejectedTimestamps.insert(scrobble.timestamp)
+                        }
                     }
-                    if let correctedAlbum = result.correctedAlbum {
-                        correctionLog.append("- Album corrected to: \(correctedAlbum)")
-                    }
-                    logger.info("\(correctionLog.joined(separator: "\n"))")
-                } else if let error = result.error {
-                    logger.error("❌ Scrobble rejected by Last.fm: \(error.rawValue)")
-                    throw LastFMError.invalidResponse
                 }
+            } catch where !Self.isScrobbleEntryError(error) {
+                logger.error("❌ Scrobble failed, \(self.pendingScrobbles.count) scrobble(s) kept for retry: \(error.localizedDescription)")
+                throw error
+            } catch {
+                if batch.count > 1 {
+                    // One bad scrobble fails the whole request, so resend this batch
+                    // one track at a time and only drop the ones Last.fm refuses
+                    logger.error("❌ Last.fm rejected a batch of \(batch.count) scrobble(s), resending individually: \(error.localizedDescription)")
+                    remainingIndividualScrobbles = batch.count
+                    continue
+                }
+                
+                logger.error("❌ Dropping scrobble of '\(batch[0].track)' rejected by Last.fm: \(error.localizedDescription)")
+                pendingScrobbles.removeAll { batchTimestamps.contains($0.timestamp) }
+                savePendingScrobbles()
+                rejectedTimestamps.formUnion(batchTimestamps)
             }
-        } catch {
-            logger.error("❌ Scrobble failed: \(error.localizedDescription)")
-            throw error
+            
+            remainingIndividualScrobbles = max(remainingIndividualScrobbles - batch.count, 0)
+        }
+        
+        return rejectedTimestamps
+    }
+    
+    /// Whether Last.fm refused a scrobble request because of the scrobbles it contained
+    /// Only invalid parameters (6) points at individual entries. Network failures,
+    /// service and rate limit errors, and session or API key errors (4, 9, 10, 13, 26)
+    /// affect every request, so the queue is kept for a later retry instead
+    nonisolated private static func isScrobbleEntryError(_ error: Error) -> Bool {
+        guard let apiError = error as? SBKError else { return false }
+        return apiError.rawValue == 6
+    }
+    
+    /// Submits scrobbles restored from a previous session once a session key is set,
+    /// rather than waiting for the next track to reach the scrobble threshold
+    private func resumePendingScrobbles() {
+        guard manager != nil, !pendingScrobbles.isEmpty else { return }
+        
+        Task {
+            try? await flushPendingScrobbles()
+        }
+    }
+    
+    /// Drops scrobbles Last.fm would ignore or that have piled up beyond the queue limit
+    /// Last.fm only accepts scrobbles from the last 14 days, and the oldest entries are
+    /// dropped first when the queue is over capacity
+    private func prunePendingScrobbles() {
+        let cutoff = Date().addingTimeInterval(-maxPendingScrobbleAge)
+        let originalCount = pendingScrobbles.count
+        
+        pendingScrobbles.removeAll { $0.timestamp < cutoff }
+        if pendingScrobbles.count > maxPendingScrobbles {
+            pendingScrobbles.removeFirst(pendingScrobbles.count - maxPendingScrobbles)
+        }
+        
+        if pendingScrobbles.count != originalCount {
+            logger.info("Dropped \(originalCount - self.pendingScrobbles.count) expired or excess pending scrobble(s)")
+            savePendingScrobbles()
+        }
+    }
+    
+    /// Restores scrobbles that were queued but not submitted in a previous session
+    private func loadPendingScrobbles() {
+        guard let data = UserDefaults.standard.data(forKey: pendingScrobblesKey),
+              let scrobbles = try? JSONDecoder().decode([PendingScrobble].self, from: data) else {
+            return
+        }
+        pendingScrobbles = scrobbles
+        prunePendingScrobbles()
+        if !pendingScrobbles.isEmpty {
+            logger.info("Restored \(self.pendingScrobbles.count) pending scrobble(s)")
+        }
+    }
+    
+    /// Persists the pending scrobble queue so offline scrobbles survive a relaunch
+    private func savePendingScrobbles() {
+        if pendingScrobbles.isEmpty {
+            UserDefaults.standard.removeObject(forKey: pendingScrobblesKey)
+        } else if let data = try? JSONEncoder().encode(pendingScrobbles) {
+            UserDefaults.standard.set(data, forKey: pendingScrobblesKey)
         }
     }
     
@@ -310,7 +500,7 @@ class LastFMService {
             throw LastFMError.configurationMissing
         }
         
-        let durationInSeconds = convertDurationToSeconds(track.duration)
+        let durationInSeconds = track.durationSeconds
         
         logger.debug("""
             🎵 Updating Now Playing:
@@ -347,7 +537,10 @@ class LastFMService {
                 logger.info("\(correctionLog.joined(separator: "\n"))")
             }
         } catch {
-            logger.error("❌ Failed to update Now Playing: \(error.localizedDescription)")
+            // A cancelled update was superseded by a newer track, so it isn't a failure
+            if !Task.isCancelled {
+                logger.error("❌ Failed to update Now Playing: \(error.localizedDescription)")
+            }
             throw error
         }
     }
@@ -355,12 +548,81 @@ class LastFMService {
     // MARK: - Album Information
     
     /// Retrieves detailed album information from Last.fm
+    /// Results are cached per artist/album for 24 hours, and concurrent requests
+    /// for the same album share a single network call
     /// - Parameters:
     ///   - artist: The album artist
     ///   - album: The album name
     /// - Returns: Detailed album information
     /// - Throws: LastFMError if the request fails
     public func getAlbumInfo(artist: String, album: String) async throws -> AlbumInfo {
+        let key = albumInfoCacheKey(artist: artist, album: album)
+        
+        if let cached = albumInfoCache[key],
+           Date().timeIntervalSince(cached.fetchedAt) < albumInfoMaxAge {
+            touchAlbumInfoCacheKey(key)
+            logger.debug("📦 Using cached album info for: \(album) by \(artist)")
+            return cached.info
+        }
+        
+        if let inFlight = albumInfoTasks[key] {
+            return try await inFlight.value.info
+        }
+        
+        let task = Task {
+            try await self.fetchAlbumInfo(artist: artist, album: album)
+        }
+        albumInfoTasks[key] = task
+        defer { albumInfoTasks[key] = nil }
+        
+        let (albumInfo, fetchedAt) = try await task.value
+        albumInfoCache[key] = (info: albumInfo, fetchedAt: fetchedAt)
+        touchAlbumInfoCacheKey(key)
+        return albumInfo
+    }
+    
+    /// Builds the cache key for an album lookup
+    /// Last.fm matches artist and album names case-insensitively, so the key does too
+    private func albumInfoCacheKey(artist: String, album: String) -> String {
+        "\(artist.lowercased())\u{1F}\(album.lowercased())"
+    }
+    
+    /// Marks a cache entry as most recently used and evicts the least recently used
+    /// entries once the cache is over capacity
+    private func touchAlbumInfoCacheKey(_ key: String) {
+        if let index = albumInfoCacheOrder.firstIndex(of: key) {
+            albumInfoCacheOrder.remove(at: index)
+        }
+        albumInfoCacheOrder.append(key)
+        
+        while albumInfoCacheOrder.count > maxCachedAlbums {
+            let evicted = albumInfoCacheOrder.removeFirst()
+            albumInfoCache[evicted] = nil
+        }
+    }
+    
+    /// Builds a file-name-safe key for the on-disk album info cache
+    /// The lowercased artist and album are hashed, as they may contain any characters
+    private func albumInfoDiskKey(artist: String, album: String) -> String {
+        let digest = SHA256.hash(data: Data(albumInfoCacheKey(artist: artist, album: album).utf8))
+        return digest.reduce(into: "") { key, byte in
+            key += "\(byte < 16 ? "0" : "")\(String(byte, radix: 16))"
+        }
+    }
+    
+    /// Fetches album information from the on-disk cache or the Last.fm API,
+    /// without consulting the in-memory cache
+    /// - Returns: The album information and when it was fetched from Last.fm
+    private func fetchAlbumInfo(artist: String, album: String) async throws -> (info: AlbumInfo, fetchedAt: Date) {
+        // Responses persist on disk, so albums loaded in earlier sessions skip the network.
+        // The entry keeps its original fetch time so it expires from memory with the file
+        let diskKey = albumInfoDiskKey(artist: artist, album: album)
+        if let cachedEntry = await albumInfoDiskCache.entry(forKey: diskKey),
+           let cached = try? JSONDecoder().decode(LastFMResponse.self, from: cachedEntry.data) {
+            logger.debug("📦 Using album info cached on disk for: \(album) by \(artist)")
+            return (info: cached.album, fetchedAt: cachedEntry.storedAt)
+        }
+        
         guard let apiKey = SecureConfig.lastFMAPIKey else {
             throw LastFMError.missingApiKey
         }
@@ -391,7 +653,8 @@ class LastFMService {
         do {
             let decoder = JSONDecoder()
             let result = try decoder.decode(LastFMResponse.self, from: data)
-            return result.album
+            await albumInfoDiskCache.store(data, forKey: diskKey)
+            return (info: result.album, fetchedAt: Date())
         } catch {
             logger.error("Failed to decode Last.fm response: \(error.localizedDescription)")
             throw LastFMError.decodingError(error)
@@ -558,29 +821,11 @@ class LastFMService {
             return result.track
         } catch {
             logger.error("❌ Failed to decode track info response: \(error.localizedDescription)")
-            if let errorString = String(data: data, encoding: .utf8) {
-                logger.debug("Response data: \(errorString)")
-            }
+            logger.debug("Response data: \(String(decoding: data, as: UTF8.self))")
             throw LastFMError.decodingError(error)
         }
     }
     
-    // MARK: - Utility Methods
-    
-    /// Converts a duration string in MM:SS format to total seconds
-    /// - Parameter duration: Duration string in MM:SS format
-    /// - Returns: Total seconds, or nil if conversion fails
-    private func convertDurationToSeconds(_ duration: String?) -> Int? {
-        guard let duration = duration else { return nil }
-        let components = duration.split(separator: ":")
-        guard components.count == 2,
-              let minutes = Int(components[0]),
-              let seconds = Int(components[1]) else {
-            return nil
-        }
-        return minutes * 60 + seconds
-    }
-    
     // MARK: - Session Management
     
     /// Sets the session key for the ScrobbleKit manager
@@ -588,6 +833,7 @@ class LastFMService {
     public func setSessionKey(_ key: String) {
         manager?.setSessionKey(key)
         logger.info("Set Last.fm session key (length: \(key.count) characters)")
+        resumePendingScrobbles()
     }
     
     /// Retrieves the stored session key from the keychain
@@ -618,6 +864,11 @@ class LastFMService {
     func clearSession() {
         manager?.setSessionKey("")
         
+        // Queued scrobbles belong to the signed-out account, so don't keep them
+        // around to be submitted for whoever signs in next
+        pendingScrobbles.removeAll()
+        savePendingScrobbles()
+        
         let query: [String: Any] = [
             kSecClass as String: kSecClassGenericPassword,
             kSecAttrAccount as String: "lastfm_session_key"
@@ -105,10 +105,8 @@ struct ShazamMatchResult {
         )
     }
     
-    /// Removes common suffixes and variations from track titles
-    /// - Parameter title: The raw title from Shazam
-    /// - Returns: A cleaned version of the title without remaster/edition suffixes
-    private static func cleanupTitle(_ title: String) -> String {
+    /// Suffix patterns stripped from titles, compiled once and applied in order
+    private static let suffixRegexes: [NSRegularExpression] = {
         // Common suffixes to remove
         let suffixesToRemove = [
             "(Remastered)",
@@ -128,17 +126,25 @@ struct ShazamMatchResult {
             "- Remastered \\d{4}",  // e.g., - Remastered 2015
         ]
         
+        return suffixesToRemove.compactMap {
+            try? NSRegularExpression(pattern: $0 + "\\s*$", options: [.caseInsensitive])
+        }
+    }()
+    
+    /// Removes common suffixes and variations from track titles
+    /// - Parameter title: The raw title from Shazam
+    /// - Returns: A cleaned version of the title without remaster/edition suffixes
+    private static func cleanupTitle(_ title: String) -> String {
         var cleanTitle = title
         
         // Remove each suffix pattern
-        for suffix in suffixesToRemove {
-            let regex = try? NSRegularExpression(pattern: suffix + "\\s*$", options: [.caseInsensitive])
-            cleanTitle = regex?.stringByReplacingMatches(
+        for regex in suffixRegexes {
+            cleanTitle = regex.stringByReplacingMatches(
                 in: cleanTitle,
                 options: [],
                 range: NSRange(cleanTitle.startIndex..., in: cleanTitle),
                 withTemplate: ""
-            ) ?? cleanTitle
+            )
         }
         
         // Trim any remaining whitespace
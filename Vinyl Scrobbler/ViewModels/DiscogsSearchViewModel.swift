@@ -33,9 +33,7 @@ class DiscogsSearchViewModel: ObservableObject {
         
         // Extract release ID from input
         let releaseId = try await discogsService.extractReleaseId(from: input)
-        let release = try await discogsService.loadRelease(releaseId)
-        appState.currentRelease = release
-        appState.loadRelease(release)
+        try await loadReleaseIfNeeded(releaseId, into: appState)
     }
     
     /// Loads a release from a search result
@@ -43,9 +41,7 @@ class DiscogsSearchViewModel: ObservableObject {
         guard let appState = appState else { return }
         
         do {
-            let release = try await discogsService.loadRelease(result.id)
-            appState.currentRelease = release
-            appState.loadRelease(release)
+            try await loadReleaseIfNeeded(result.id, into: appState)
         } catch {
             print("Failed to load release: \(error.localizedDescription)")
         }
@@ -57,9 +53,7 @@ class DiscogsSearchViewModel: ObservableObject {
         
         do {
             let releaseId = try await discogsService.extractReleaseId(from: url.absoluteString)
-            let release = try await discogsService.loadRelease(releaseId)
-            appState.currentRelease = release
-            appState.loadRelease(release)
+            try await loadReleaseIfNeeded(releaseId, into: appState)
         } catch {
             print("Failed to load release from URL: \(error.localizedDescription)")
         }
@@ -113,9 +107,11 @@ class DiscogsSearchViewModel: ObservableObject {
         results = response.results.filter { result in
             guard let formats = result.format else { return false }
             return formats.contains { format in
-                format.lowercased().contains("vinyl") ||
-                format.lowercased().contains("lp") ||
-                format.lowercased().contains("12\"")
+                // Lowercase once per format rather than once per check
+                let format = format.lowercased()
+                return format.contains("vinyl") ||
+                    format.contains("lp") ||
+                    format.contains("12\"")
             }
         }
         
@@ -129,7 +125,23 @@ class DiscogsSearchViewModel: ObservableObject {
     func selectRelease(_ result: DiscogsSearchResponse.SearchResult) async throws {
         guard let appState = appState else { return }
         
-        let release = try await discogsService.loadRelease(result.id)
+        try await loadReleaseIfNeeded(result.id, into: appState)
+    }
+    
+    /// Fetches a release and loads it into the player, unless it is already loaded
+    /// Reloading the current release would refetch it and reset its tracks, artwork
+    /// and durations for no change
+    /// - Parameters:
+    ///   - releaseId: The Discogs release ID to load
+    ///   - appState: The app state to load the release into
+    private func loadReleaseIfNeeded(_ releaseId: Int, into appState: AppState) async throws {
+        if appState.currentRelease?.id == releaseId, !appState.tracks.isEmpty {
+            logger.info("Release \(releaseId) is already loaded, skipping reload")
+            return
+        }
+        
+        let release = try await discogsService.loadRelease(releaseId)
+        appState.currentRelease = release
         appState.loadRelease(release)
     }
 }
\ No newline at end of file
@@ -88,10 +88,11 @@ struct DurationView: View {
         let durationString = String(duration)
         let titleData = Data(durationString.utf8)
         let hash = SHA256.hash(data: titleData)
-        let hashString = hash.compactMap { String(format: "%02x", $0) }.joined()
-        
-        // Seed random generator with hash for consistent results
-        var generator = SeededRandomNumberGenerator(seed: UInt64(hashString.prefix(16), radix: 16) ?? 0)
+
+        // Seed random generator with the first 8 digest bytes (big-endian)
+        // for consistent results, without a hex string round-trip
+        let seed = hash.prefix(8).reduce(UInt64(0)) { ($0 << 8) | UInt64($1) }
+        var generator = SeededRandomNumberGenerator(seed: seed)
         
         // Generate smooth, connected waveform points
         var points: [CGPoint] = []
@@ -131,9 +132,8 @@ struct DurationView: View {
     /// - Parameter seconds: Duration in seconds
     /// - Returns: Formatted duration string
     private func formatDuration(_ seconds: Double) -> String {
-        let minutes = Int(seconds) / 60
-        let remainingSeconds = Int(seconds) % 60
-        return String(format: "%d:%02d", minutes, remainingSeconds)
+        let (minutes, remainingSeconds) = Int(seconds).quotientAndRemainder(dividingBy: 60)
+        return "\(minutes):\(remainingSeconds < 10 ? "0" : "")\(remainingSeconds)"
     }
 }
 
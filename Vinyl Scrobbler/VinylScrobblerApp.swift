@@ -21,6 +21,14 @@ struct VinylScrobblerApp: App {
         let logger = Logger(subsystem: subsystem, category: viewBridgeLogCategory)
         logger.critical("Suppressing ViewBridge warnings")
         setbuf(stdout, nil)
+        
+        // Give AsyncImage artwork loads a cache large enough to hold album covers
+        // across launches, so reloading a release doesn't re-download its artwork
+        URLCache.shared = URLCache(
+            memoryCapacity: 32 * 1024 * 1024,
+            diskCapacity: 256 * 1024 * 1024,
+            directory: nil
+        )
     }
     
     var body: some Scene {